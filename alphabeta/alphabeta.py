@@ -2,14 +2,243 @@
 N-Queens Game - Alpha-Beta Search Module
 This module contains the AI logic using the alpha-beta pruning algorithm.
 """
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import time
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is an optional accelerator; fall back to pure Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Integer score sentinels: evaluation is bounded to [-1000, 1000], and
+# plain int comparisons are cheaper than boxed float('inf') ones
+NEG_INF = -(1 << 30)
+POS_INF = 1 << 30
+
+# Transposition-table entry flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+
+@njit(cache=True)
+def _popcount(x):
+    """
+    Count the set bits of a non-negative integer.
+
+    Args:
+        x (int): Value to count bits in
+
+    Returns:
+        int: Number of set bits
+    """
+    count = 0
+    while x:
+        x &= x - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def _evaluate_masks(rows, cols, diag1, diag2, n):
+    """
+    Evaluate a board state given as attack-line bitmasks.
+
+    Args:
+        rows (int): Bitmask of occupied rows
+        cols (int): Bitmask of occupied columns
+        diag1 (int): Bitmask of occupied "/" diagonals (row + col)
+        diag2 (int): Bitmask of occupied "\\" diagonals (col - row + n - 1)
+        n (int): Board size
+
+    Returns:
+        int: A heuristic value representing the board state quality
+    """
+    full = (1 << n) - 1
+    queens_placed = _popcount(rows)
+
+    # If all queens are placed successfully, this is the best outcome
+    if queens_placed == n:
+        return 1000
+
+    # Count the safe columns of the next row to fill - a single popcount
+    row = 0
+    for r in range(n):
+        if not (rows >> r) & 1:
+            row = r
+            break
+    safe_positions = _popcount(
+        ~(cols | (diag1 >> row) | (diag2 >> (n - 1 - row))) & full
+    )
+
+    # If the next row is fully attacked, this line of play is dead
+    if safe_positions == 0:
+        return -1000
+
+    # Otherwise, the score is based on queens placed and safe positions available
+    return queens_placed * 10 + safe_positions
+
+
+# Note: no cache=True here — numba's on-disk caching is unreliable for
+# self-recursive functions and can crash at load time
+@njit
+def _ab_search(rows, cols, diag1, diag2, n, depth, alpha, beta, color, free):
+    """
+    Negamax alpha-beta recursion over bitmask state.
+
+    Scores are from the side-to-move's perspective: each level negates the
+    child's score and searches with the window flipped to (-beta, -alpha),
+    so one branch serves both players.
+
+    Args:
+        rows (int): Bitmask of occupied rows
+        cols (int): Bitmask of occupied columns
+        diag1 (int): Bitmask of occupied "/" diagonals
+        diag2 (int): Bitmask of occupied "\\" diagonals
+        n (int): Board size
+        depth (int): Remaining search depth
+        alpha (int): Alpha value for pruning
+        beta (int): Beta value for pruning
+        color (int): +1 if the maximizing player is to move, -1 otherwise
+        free (int): Safe-column mask of the next unassigned row, already
+            computed by the caller while ordering its candidates
+
+    Returns:
+        tuple: (evaluation score for the side to move, number of nodes visited)
+    """
+    nodes = 1
+    full = (1 << n) - 1
+
+    # Terminal conditions
+    if depth == 0 or rows == full:
+        return color * _evaluate_masks(rows, cols, diag1, diag2, n), nodes
+
+    # Branch on the columns of the next unassigned row; its safe-column
+    # mask came in from the parent as a pure delta of the attack masks
+    row = 0
+    for r in range(n):
+        if not (rows >> r) & 1:
+            row = r
+            break
+
+    # If no valid moves, return evaluation
+    if free == 0:
+        return color * _evaluate_masks(rows, cols, diag1, diag2, n), nodes
+
+    # The free row that would be searched after this one, for move ordering
+    next_row = -1
+    for r in range(row + 1, n):
+        if not (rows >> r) & 1:
+            next_row = r
+            break
+
+    # Collect candidate columns, insertion-sorted by how constrained the
+    # following row becomes (fewest remaining options first, to fail fast).
+    # The mask computed for each candidate's key is exactly the free mask
+    # the child needs, so it is kept and passed down instead of recomputed.
+    cand_cols = np.empty(n, np.int64)
+    cand_keys = np.empty(n, np.int64)
+    cand_free = np.empty(n, np.int64)
+    count = 0
+    f = free
+    while f:
+        bit = f & -f
+        f ^= bit
+        col = 0
+        b = bit
+        while b > 1:
+            b >>= 1
+            col += 1
+        key = 0
+        child_free = 0
+        if next_row >= 0:
+            new_cols = cols | bit
+            new_d1 = diag1 | (1 << (row + col))
+            new_d2 = diag2 | (1 << (col - row + n - 1))
+            child_free = ~(new_cols | (new_d1 >> next_row) | (new_d2 >> (n - 1 - next_row))) & full
+            key = _popcount(child_free)
+        i = count
+        while i > 0 and cand_keys[i - 1] > key:
+            cand_keys[i] = cand_keys[i - 1]
+            cand_cols[i] = cand_cols[i - 1]
+            cand_free[i] = cand_free[i - 1]
+            i -= 1
+        cand_keys[i] = key
+        cand_cols[i] = col
+        cand_free[i] = child_free
+        count += 1
+
+    new_rows = rows | (1 << row)
+
+    best = NEG_INF
+    for idx in range(count):
+        col = cand_cols[idx]
+        eval_score, child_nodes = _ab_search(
+            new_rows,
+            cols | (1 << col),
+            diag1 | (1 << (row + col)),
+            diag2 | (1 << (col - row + n - 1)),
+            n, depth - 1, -beta, -alpha, -color, cand_free[idx]
+        )
+        eval_score = -eval_score
+        nodes += child_nodes
+
+        # Update best score and alpha
+        if eval_score > best:
+            best = eval_score
+        if eval_score > alpha:
+            alpha = eval_score
+
+        # Alpha-Beta pruning
+        if alpha >= beta:
+            break
+
+    return best, nodes
+
+
+def _eval_root_move(args):
+    """
+    Evaluate one root move in a worker process.
+
+    Args:
+        args (tuple): Post-move mask state and remaining depth, as
+            (rows, cols, diag1, diag2, n, depth)
+
+    Returns:
+        tuple: (score for the root player, nodes visited)
+    """
+    rows, cols, diag1, diag2, n, depth = args
+    full = (1 << n) - 1
+    row = -1
+    for r in range(n):
+        if not (rows >> r) & 1:
+            row = r
+            break
+    free = 0
+    if row >= 0:
+        free = ~(cols | (diag1 >> row) | (diag2 >> (n - 1 - row))) & full
+
+    # The opponent replies, so search with color=-1 and negate back
+    score, nodes = _ab_search(rows, cols, diag1, diag2, n, depth,
+                              NEG_INF, POS_INF, -1, free)
+    return -score, nodes
+
+
 class AlphaBetaAI:
     def __init__(self, board, max_depth=4):
         """
         Initialize the Alpha-Beta AI with a board.
-        
+
         Args:
             board: The Board object
             max_depth: Maximum search depth
@@ -18,127 +247,241 @@ class AlphaBetaAI:
         self.max_depth = max_depth
         self.nodes_evaluated = 0
         self.search_time = 0
-        
+        # Transposition table: mask state -> (score, bound flag)
+        self.tt = {}
+        # Root-move scores from the previous deepening iteration
+        self.move_ordering = {}
+        # Worker pool for root-level parallel search, created on first use
+        self._pool = None
+
+    def reset_search_state(self):
+        """
+        Clear per-game search state (transposition table, root-move
+        ordering, stats) while keeping the worker pool and any compiled
+        kernel alive across games.
+        """
+        self.tt.clear()
+        self.move_ordering = {}
+        self.nodes_evaluated = 0
+        self.search_time = 0
+
+    def _order_columns(self, row, safe_cols):
+        """
+        Order candidate columns for a row by how constrained the following
+        row becomes (fewest remaining options first, to fail fast).
+
+        Args:
+            row (int): Row the candidates belong to
+            safe_cols (list): Safe column indices for that row
+
+        Returns:
+            list: The columns sorted by remaining safe-column count
+        """
+        board = self.board
+        n = board.size
+
+        # Find the free row that would be searched next
+        next_row = None
+        for r in range(n):
+            if r != row and not (board.rows >> r) & 1:
+                next_row = r
+                break
+        if next_row is None:
+            return safe_cols
+
+        full = (1 << n) - 1
+
+        def count_left(col):
+            cols = board.cols | (1 << col)
+            diag1 = board.diag1 | (1 << (row + col))
+            diag2 = board.diag2 | (1 << (col - row + n - 1))
+            free = ~(cols | (diag1 >> next_row) | (diag2 >> (n - 1 - next_row))) & full
+            return free.bit_count()
+
+        return sorted(safe_cols, key=count_left)
+
     def alpha_beta_search(self, depth, alpha, beta, is_maximizing_player):
         """
         Alpha-Beta pruning algorithm.
-        
+
+        Runs on the board's bitmask state via the module-level kernel, which
+        is compiled with numba when available.
+
         Args:
             depth (int): Current depth in the game tree
             alpha (float): Alpha value for pruning
             beta (float): Beta value for pruning
             is_maximizing_player (bool): True if current player is maximizing
-            
+
         Returns:
             float: The evaluation score
         """
-        self.nodes_evaluated += 1
-        
-        # Terminal conditions
-        if depth == 0 or self.board.is_game_over():
-            return self.board.evaluate()
-        
-        safe_positions = self.board.get_safe_positions()
-        
-        # If no valid moves, return evaluation
-        if not safe_positions:
-            return self.board.evaluate()
-        
-        if is_maximizing_player:
-            max_eval = float('-inf')
-            for i, j in safe_positions:
-                # Make move
-                self.board.board[i, j] = 1
-                self.board.queens_left -= 1
-                
-                # Recursive evaluation
-                eval_score = self.alpha_beta_search(depth - 1, alpha, beta, False)
-                
-                # Undo move
-                self.board.board[i, j] = 0
-                self.board.queens_left += 1
-                
-                # Update best score and alpha
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, eval_score)
-                
-                # Alpha-Beta pruning
-                if beta <= alpha:
-                    break
-                    
-            return max_eval
+        board = self.board
+        alpha = int(max(alpha, NEG_INF))
+        beta = int(min(beta, POS_INF))
+
+        # The three masks already form a perfect key - no hashing needed.
+        # Positions reached through different move orders collapse here.
+        key = (board.rows, board.cols, board.diag1, board.diag2,
+               depth, is_maximizing_player)
+        hit = self.tt.get(key)
+        if hit is not None:
+            score, flag = hit
+            if flag == TT_EXACT:
+                return score
+            if flag == TT_LOWER and score >= beta:
+                return score
+            if flag == TT_UPPER and score <= alpha:
+                return score
+
+        # The kernel works in the side-to-move frame; flip the window and the
+        # returned score for the minimizing player
+        color = 1 if is_maximizing_player else -1
+        a, b = (alpha, beta) if color == 1 else (-beta, -alpha)
+
+        # Seed the kernel with the free mask of the next row to fill
+        n = board.size
+        row = board.next_free_row()
+        free = 0
+        if row is not None:
+            free = ~(board.cols | (board.diag1 >> row)
+                     | (board.diag2 >> (n - 1 - row))) & ((1 << n) - 1)
+
+        score, nodes = _ab_search(
+            board.rows, board.cols, board.diag1, board.diag2,
+            n, depth, a, b, color, free
+        )
+        score *= color
+        self.nodes_evaluated += nodes
+
+        if score <= alpha:
+            flag = TT_UPPER
+        elif score >= beta:
+            flag = TT_LOWER
         else:
-            min_eval = float('inf')
-            for i, j in safe_positions:
-                # Make move
-                self.board.board[i, j] = 1
-                self.board.queens_left -= 1
-                
-                # Recursive evaluation
-                eval_score = self.alpha_beta_search(depth - 1, alpha, beta, True)
-                
-                # Undo move
-                self.board.board[i, j] = 0
-                self.board.queens_left += 1
-                
-                # Update best score and beta
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, eval_score)
-                
-                # Alpha-Beta pruning
-                if beta <= alpha:
-                    break
-                    
-            return min_eval
-        
+            flag = TT_EXACT
+        self.tt[key] = (score, flag)
+        return score
+
     def get_best_move(self):
         """
         Find the best move for the AI using alpha-beta pruning.
-        
+
         Returns:
             tuple: (row, col) or None if no valid moves
             dict: Statistics about the search
         """
         start_time = time.time()
         self.nodes_evaluated = 0
-        
-        safe_positions = self.board.get_safe_positions()
-        
+
+        # The human may fill rows out of order, so fall through to the next
+        # free row that still has a safe column
+        row = None
+        safe_cols = []
+        for r in range(self.board.size):
+            if (self.board.rows >> r) & 1:
+                continue
+            cols = self.board.safe_cols_for_row(r)
+            if cols:
+                row, safe_cols = r, cols
+                break
+
         # If no valid moves, return None
-        if not safe_positions:
+        if not safe_cols:
             self.search_time = time.time() - start_time
             return None, self._get_stats()
-        
-        best_score = float('-inf')
+
+        # On an empty board column c and its mirror n-1-c lead to reflected,
+        # equivalent games, so only the left half needs to be searched
+        if self.board.queens_left == self.board.size:
+            safe_cols = [c for c in safe_cols if c < (self.board.size + 1) // 2]
+
         best_move = None
-        
-        # Try each valid move and choose the one with highest score
-        for i, j in safe_positions:
-            # Make move
-            self.board.board[i, j] = 1
-            self.board.queens_left -= 1
-            
-            # Evaluate with alpha-beta
-            score = self.alpha_beta_search(
-                self.max_depth, float('-inf'), float('inf'), False
-            )
-            
-            # Undo move
-            self.board.board[i, j] = 0
-            self.board.queens_left += 1
-            
-            # Update best move
-            if score > best_score:
-                best_score = score
-                best_move = (i, j)
-        
+        ordered = self._order_columns(row, safe_cols)
+        self.move_ordering = {}
+
+        # Deep searches farm the independent root subtrees out to worker
+        # processes; shallow ones aren't worth the dispatch overhead
+        if self.max_depth > 2 and len(ordered) > 1:
+            best_move = self._search_root_parallel(row, ordered)
+            self.search_time = time.time() - start_time
+            return best_move, self._get_stats()
+
+        # Deepen iteratively: each completed depth scores the root moves,
+        # and searching the best ones first at the next depth keeps the
+        # expensive final iteration close to best-first
+        for d in range(1, self.max_depth + 1):
+            if self.move_ordering:
+                ordered.sort(key=self.move_ordering.get, reverse=True)
+
+            best_score = NEG_INF
+            best_move = None
+            for j in ordered:
+                # Make move
+                self.board.place_queen(row, j)
+
+                # Evaluate with alpha-beta
+                score = self.alpha_beta_search(
+                    d, NEG_INF, POS_INF, False
+                )
+
+                # Undo move
+                self.board.remove_queen(row, j)
+
+                # Update best move
+                self.move_ordering[j] = score
+                if score > best_score:
+                    best_score = score
+                    best_move = (row, j)
+
         self.search_time = time.time() - start_time
         return best_move, self._get_stats()
-    
+
+    def _search_root_parallel(self, row, ordered):
+        """
+        Evaluate each root move in its own worker process.
+
+        Root subtrees are independent, so they parallelize cleanly. The
+        transposition table and deepening order are process-local, so each
+        worker runs a single full-depth search of its subtree instead.
+
+        Args:
+            row (int): Row being filled at the root
+            ordered (list): Candidate columns for that row
+
+        Returns:
+            tuple: Best (row, col) found
+        """
+        board = self.board
+        n = board.size
+
+        tasks = []
+        for j in ordered:
+            tasks.append((
+                board.rows | (1 << row),
+                board.cols | (1 << j),
+                board.diag1 | (1 << (row + j)),
+                board.diag2 | (1 << (j - row + n - 1)),
+                n, self.max_depth
+            ))
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor()
+
+        best_score = NEG_INF
+        best_move = None
+        for j, (score, nodes) in zip(ordered, self._pool.map(_eval_root_move, tasks)):
+            self.nodes_evaluated += nodes
+            self.move_ordering[j] = score
+            if score > best_score:
+                best_score = score
+                best_move = (row, j)
+        return best_move
+
     def _get_stats(self):
         """
         Get statistics about the last search.
-        
+
         Returns:
             dict: Search statistics
         """
@@ -146,4 +489,4 @@ class AlphaBetaAI:
             'nodes_evaluated': self.nodes_evaluated,
             'search_time': self.search_time,
             'nodes_per_second': self.nodes_evaluated / max(0.001, self.search_time)
-        }
\ No newline at end of file
+        }
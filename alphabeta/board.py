@@ -1,128 +1,238 @@
-""" 
+"""
 N-Queens Game - Board Module
 This module contains the logic for the game board and queen placement rules.
 """
+from functools import lru_cache
+
 import numpy as np
 
+
+@lru_cache(maxsize=1 << 20)
+def _evaluate(rows, cols, diag1, diag2, n, queens_left):
+    """
+    Evaluate a board state given as attack-line bitmasks.
+
+    Memoized on the mask tuple: states reached again through different
+    move orders reuse the cached score.
+
+    Args:
+        rows (int): Bitmask of occupied rows
+        cols (int): Bitmask of occupied columns
+        diag1 (int): Bitmask of occupied "/" diagonals
+        diag2 (int): Bitmask of occupied "\\" diagonals
+        n (int): Board size
+        queens_left (int): Queens still to place
+
+    Returns:
+        int: A heuristic value representing the board state quality
+    """
+    queens_placed = n - queens_left
+
+    # If all queens are placed successfully, this is the best outcome
+    if queens_placed == n:
+        return 1000
+
+    # Count the safe columns of the next row to fill - a single popcount
+    # instead of a full-board rescan
+    row = 0
+    for r in range(n):
+        if not (rows >> r) & 1:
+            row = r
+            break
+    free = ~(cols | (diag1 >> row) | (diag2 >> (n - 1 - row))) & ((1 << n) - 1)
+    safe_positions = free.bit_count()
+
+    # If the next row is fully attacked, this line of play is dead
+    if safe_positions == 0:
+        return -1000
+
+    # Otherwise, the score is based on queens placed and safe positions available
+    return queens_placed * 10 + safe_positions
+
+
 class Board:
     def __init__(self, size):
         """
         Initialize the N-Queens board.
-        
+
         Args:
             size (int): The size of the board (n x n)
         """
         self.size = size
-        self.board = np.zeros((size, size))
+        self.board = np.zeros((size, size), dtype=np.int8)
         self.queens_left = size
-        
+        # Bitmasks of the attacked lines: one bit per row/column/diagonal
+        self.rows = 0
+        self.cols = 0
+        self.diag1 = 0  # "/" diagonals, indexed by row + col
+        self.diag2 = 0  # "\" diagonals, indexed by col - row + size - 1
+        # Occupancy mask over the n*n cells and per-cell attack masks
+        self.occ = 0
+        self.attacks = self._build_attacks()
+
+    def _build_attacks(self):
+        """
+        Precompute, for every cell, a bitmask over the n*n cells covered by
+        a queen placed there (the cell itself included).
+
+        Returns:
+            list: Attack mask for each cell, indexed by row * size + col
+        """
+        n = self.size
+        attacks = []
+        for r in range(n):
+            for c in range(n):
+                mask = 0
+                for i in range(n):
+                    for j in range(n):
+                        if i == r or j == c or i + j == r + c or i - j == r - c:
+                            mask |= 1 << (i * n + j)
+                attacks.append(mask)
+        return attacks
+
     def reset(self, size=None):
         """
         Reset the board to the initial state.
-        
+
         Args:
             size (int, optional): New size for the board, if None the current size is used.
         """
         if size is not None:
             self.size = size
-        self.board = np.zeros((self.size, self.size))
+        self.board = np.zeros((self.size, self.size), dtype=np.int8)
         self.queens_left = self.size
-        
+        self.rows = 0
+        self.cols = 0
+        self.diag1 = 0
+        self.diag2 = 0
+        self.occ = 0
+        self.attacks = self._build_attacks()
+        _evaluate.cache_clear()
+
     def place_queen(self, row, col):
         """
         Place a queen at the specified position.
-        
+
         Args:
             row (int): Row index
             col (int): Column index
-            
+
         Returns:
             bool: True if queen was successfully placed, False otherwise
         """
         if self.is_safe(row, col):
             self.board[row, col] = 1
+            self.rows |= 1 << row
+            self.cols |= 1 << col
+            self.diag1 |= 1 << (row + col)
+            self.diag2 |= 1 << (col - row + self.size - 1)
+            self.occ |= 1 << (row * self.size + col)
             self.queens_left -= 1
             return True
         return False
-        
+
+    def remove_queen(self, row, col):
+        """
+        Remove the queen at the specified position (undo a placement).
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+        """
+        self.board[row, col] = 0
+        self.rows ^= 1 << row
+        self.cols ^= 1 << col
+        self.diag1 ^= 1 << (row + col)
+        self.diag2 ^= 1 << (col - row + self.size - 1)
+        self.occ ^= 1 << (row * self.size + col)
+        self.queens_left += 1
+
     def is_safe(self, row, col):
         """
         Check if it's safe to place a queen at the specified position.
-        
+
         Args:
             row (int): Row index
             col (int): Column index
-            
+
         Returns:
             bool: True if position is safe, False otherwise
         """
+        # One AND against the precomputed attack mask of the cell; the mask
+        # covers the cell itself, so occupancy is included in the test
+        return not (self.occ & self.attacks[row * self.size + col])
+
+    def next_free_row(self):
+        """
+        Get the lowest row that does not contain a queen yet.
+
+        Returns:
+            int: Row index, or None if every row is occupied
+        """
+        for row in range(self.size):
+            if not (self.rows >> row) & 1:
+                return row
+        return None
+
+    def safe_cols_for_row(self, row):
+        """
+        Get the columns where a queen can safely be placed in the given row.
+
+        Args:
+            row (int): Row index
+
+        Returns:
+            list: List of safe column indices
+        """
+        cols = []
         n = self.size
-        
-        # Check if the position is already occupied
-        if self.board[row, col] == 1:
-            return False
-        
-        # Check row and column
-        for i in range(n):
-            if self.board[row, i] == 1 or self.board[i, col] == 1:
-                return False
-        
-        # Check diagonals
-        for i in range(n):
-            for j in range(n):
-                if (i + j == row + col) or (i - j == row - col):
-                    if self.board[i, j] == 1:
-                        return False
-        
-        return True
-    
+        free = ~(self.cols | (self.diag1 >> row) | (self.diag2 >> (n - 1 - row))) & ((1 << n) - 1)
+        while free:
+            bit = free & -free
+            free ^= bit
+            cols.append(bit.bit_length() - 1)
+        return cols
+
     def get_safe_positions(self):
         """
         Get all safe positions on the board for placing a queen.
-        
+
         Returns:
             list: List of tuples (row, col) for all safe positions
         """
         safe_positions = []
-        for i in range(self.size):
-            for j in range(self.size):
-                if self.board[i, j] == 0 and self.is_safe(i, j):
-                    safe_positions.append((i, j))
+        n = self.size
+        full = (1 << n) - 1
+        for row in range(n):
+            if (self.rows >> row) & 1:
+                continue
+            # Columns of this row not attacked by any placed queen
+            free = ~(self.cols | (self.diag1 >> row) | (self.diag2 >> (n - 1 - row))) & full
+            while free:
+                bit = free & -free
+                free ^= bit
+                safe_positions.append((row, bit.bit_length() - 1))
         return safe_positions
-        
+
     def evaluate(self):
         """
         Evaluate the current board state for the alpha-beta algorithm.
-        
+
         Returns:
             int: A heuristic value representing the board state quality
         """
-        n = self.size
-        queens_placed = n - self.queens_left
-        
-        # If all queens are placed successfully, this is the best outcome
-        if queens_placed == n:
-            return 1000
-            
-        # Count the number of safe positions remaining
-        safe_positions = len(self.get_safe_positions())
-        
-        # If we have no safe positions left but haven't placed all queens, bad position
-        if safe_positions == 0 and queens_placed < n:
-            return -1000
-            
-        # Otherwise, the score is based on queens placed and safe positions available
-        return queens_placed * 10 + safe_positions
-        
+        return _evaluate(self.rows, self.cols, self.diag1, self.diag2,
+                         self.size, self.queens_left)
+
     def is_game_over(self):
         """
         Check if the game is over (all queens placed).
-        
+
         Returns:
             bool: True if game is over, False otherwise
         """
         return self.queens_left == 0
-        
+
     def print_board(self):
         """
         Print the current board state to the console.
@@ -134,4 +244,4 @@ class Board:
                     print('Q', end=' ')
                 else:
                     print('.', end=' ')
-            print()
\ No newline at end of file
+            print()
@@ -6,11 +6,13 @@ import os
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 from PIL import ImageTk, Image
-import numpy as np
 
 from board import Board
 from alphabeta import AlphaBetaAI
 
+# Resized queen images, cached per cell size so resets never re-decode
+_QUEEN_IMG_CACHE = {}
+
 class NQueensGUI:
     def __init__(self, root):
         """
@@ -58,6 +60,7 @@ class NQueensGUI:
         self.depth_frame.pack(fill=tk.X, pady=2)
         
         tk.Label(self.depth_frame, text="Search Depth:").pack(side=tk.LEFT)
+        self._depth_after_id = None
         self.depth_var = tk.IntVar(value=4)
         self.depth_scale = tk.Scale(self.depth_frame, from_=1, to=6, orient=tk.HORIZONTAL,
                                    variable=self.depth_var, command=self.update_ai_depth)
@@ -107,24 +110,30 @@ class NQueensGUI:
         
         # Load the queen image
         self.load_queen_image()
-        
-        # Draw the initial board
-        self.draw_board()
-        
+
         # Highlight hint (if any)
         self.hint_highlight = None
-        
+
+        # Create the board cells once and draw the initial state
+        self._build_board_items()
+        self.draw_board()
+
         # Bind click event
         self.canvas.bind("<Button-1>", self.on_board_click)
         
     def load_queen_image(self):
         """
-        Load the queen image for the board.
+        Load the queen image for the board, reusing the cached copy if one
+        was already prepared for this cell size.
         """
+        if self.cell_size in _QUEEN_IMG_CACHE:
+            self.queen_photo = _QUEEN_IMG_CACHE[self.cell_size]
+            return
+
         # Check if images directory exists
         if not os.path.exists("images"):
             os.makedirs("images")
-            
+
         # Check if Queen.jpg exists, if not create a placeholder
         if not os.path.exists("images/Queen.jpg"):
             # Create a placeholder image with a simple queen symbol
@@ -132,36 +141,58 @@ class NQueensGUI:
             self.queen_photo = ImageTk.PhotoImage(img)
             print("Warning: Queen.jpg not found. Using placeholder image.")
         else:
-            # Load the actual queen image
+            # Load the actual queen image; bilinear is plenty for a board icon
             queen_image = Image.open("images/Queen.jpg")
-            queen_image = queen_image.resize((self.cell_size, self.cell_size), Image.LANCZOS)
+            queen_image = queen_image.resize((self.cell_size, self.cell_size), Image.BILINEAR)
             self.queen_photo = ImageTk.PhotoImage(queen_image)
+
+        _QUEEN_IMG_CACHE[self.cell_size] = self.queen_photo
     
-    def draw_board(self):
+    def _build_board_items(self):
         """
-        Draw the chess board and queens.
+        Create the checkerboard cells once; subsequent draws only add or
+        remove queen images instead of recreating every canvas item.
         """
         self.canvas.delete("all")
-        
-        # Draw the chess board
+        self.cell_ids = {}
+        self.queen_ids = {}
         for row in range(self.n):
             for col in range(self.n):
                 color = 'white' if (row + col) % 2 == 0 else 'gray'
-                self.canvas.create_rectangle(
-                    col * self.cell_size, row * self.cell_size, 
+                self.cell_ids[(row, col)] = self.canvas.create_rectangle(
+                    col * self.cell_size, row * self.cell_size,
                     (col + 1) * self.cell_size, (row + 1) * self.cell_size,
                     fill=color, tags=f"cell_{row}_{col}"
                 )
-        
-        # Place the queens on the board
+
+    def _clear_hint(self):
+        """
+        Restore the normal color of the currently highlighted hint cell.
+        """
+        if self.hint_highlight:
+            row, col = self.hint_highlight
+            color = 'white' if (row + col) % 2 == 0 else 'gray'
+            self.canvas.itemconfig(self.cell_ids[(row, col)], fill=color)
+            self.hint_highlight = None
+
+    def draw_board(self):
+        """
+        Sync the canvas with the board: add images for newly placed queens
+        and drop images of removed ones.
+        """
         for i in range(self.n):
             for j in range(self.n):
-                if self.board.board[i, j] == 1:
-                    self.canvas.create_image(
-                        j * self.cell_size, i * self.cell_size, 
+                has_queen = self.board.board[i, j] == 1
+                item = self.queen_ids.get((i, j))
+                if has_queen and item is None:
+                    self.queen_ids[(i, j)] = self.canvas.create_image(
+                        j * self.cell_size, i * self.cell_size,
                         anchor='nw', image=self.queen_photo
                     )
-        
+                elif not has_queen and item is not None:
+                    self.canvas.delete(item)
+                    del self.queen_ids[(i, j)]
+
         # Update the game info
         self.queens_var.set(f"Queens left: {self.board.queens_left}")
         
@@ -173,10 +204,8 @@ class NQueensGUI:
             event: The mouse click event
         """
         # Clear any hint highlight
-        if self.hint_highlight:
-            self.draw_board()
-            self.hint_highlight = None
-        
+        self._clear_hint()
+
         if self.board.is_game_over():  # Game already over
             messagebox.showinfo("Game Over", "Game is already finished! Reset to play again.")
             return
@@ -256,15 +285,25 @@ class NQueensGUI:
         row, col = move
         
         # Highlight the suggested move
+        self._clear_hint()
         self.hint_highlight = (row, col)
-        cell_id = f"cell_{row}_{col}"
-        self.canvas.itemconfig(cell_id, fill="light green")
+        self.canvas.itemconfig(self.cell_ids[(row, col)], fill="light green")
         self.status_var.set(f"Hint: Try placing a queen at position ({row}, {col}).")
     
     def update_ai_depth(self, *args):
         """
-        Update the AI search depth.
+        Debounce slider drags: the scale fires for every tick while being
+        dragged, so only apply the value once it has settled for a moment.
+        """
+        if self._depth_after_id is not None:
+            self.root.after_cancel(self._depth_after_id)
+        self._depth_after_id = self.root.after(100, self._apply_depth)
+
+    def _apply_depth(self):
         """
+        Apply the depth selected on the slider to the AI.
+        """
+        self._depth_after_id = None
         new_depth = self.depth_var.get()
         self.ai.max_depth = new_depth
         self.status_var.set(f"AI search depth set to {new_depth}")
@@ -278,8 +317,8 @@ class NQueensGUI:
         if new_size is not None:
             self.n = new_size
             self.board.reset(new_size)
-            self.ai = AlphaBetaAI(self.board)
-            
+            self.ai.reset_search_state()
+
             # Resize the canvas
             self.canvas.config(width=self.n * self.cell_size, height=self.n * self.cell_size)
             
@@ -287,10 +326,11 @@ class NQueensGUI:
             self.nodes_var.set("Nodes evaluated: 0")
             self.time_var.set("Search time: 0.00 s")
             self.nps_var.set("Nodes/second: 0")
-            
+
             # Clear any hint highlight
             self.hint_highlight = None
-            
-            # Redraw the board
+
+            # Rebuild the cells for the new size and redraw the board
+            self._build_board_items()
             self.draw_board()
             self.status_var.set("Game reset. Place queens on the board.")
\ No newline at end of file
@@ -5,113 +5,233 @@ This module contains the logic for the game board and queen placement rules.
 import numpy as np
 
 class Board:
+    # Fixed attribute layout: no per-instance __dict__, and attribute access
+    # skips a dict lookup on every hot-path read
+    __slots__ = ('size', '_buf', 'board', 'queens_left', 'rows', 'cols',
+                 'diag1', 'diag2', 'conflicts', 'row_counts', 'col_counts',
+                 'diag_counts', 'anti_counts', 'occ', 'attacks')
+
     def __init__(self, size):
         """
         Initialize the N-Queens board.
-        
+
         Args:
             size (int): The size of the board (n x n)
         """
         self.size = size
-        self.board = np.zeros((size, size))
+        # The grid lives in a bytearray so the hot paths index it with
+        # native ints; the NumPy view shares the buffer for vectorized
+        # reads and the GUI's display loop
+        self._buf = bytearray(size * size)
+        self.board = np.frombuffer(self._buf, dtype=np.uint8).reshape(size, size)
         self.queens_left = size
-    
+        # Bitmasks of the attacked lines: one bit per row/column/diagonal
+        self.rows = 0
+        self.cols = 0
+        self.diag1 = 0  # "/" diagonals, indexed by row + col
+        self.diag2 = 0  # "\" diagonals, indexed by col - row + size - 1
+        # Number of lines shared by more than one queen, kept incrementally
+        self.conflicts = 0
+        # Per-line queen counts, updated on every place/remove
+        self.row_counts = np.zeros(size, dtype=np.int32)
+        self.col_counts = np.zeros(size, dtype=np.int32)
+        self.diag_counts = np.zeros(2 * size - 1, dtype=np.int32)
+        self.anti_counts = np.zeros(2 * size - 1, dtype=np.int32)
+        # Occupancy mask over the n*n cells and per-cell attack masks
+        self.occ = 0
+        self.attacks = self._build_attacks()
+
+    def _build_attacks(self):
+        """
+        Precompute, for every cell, a bitmask over the n*n cells covered by
+        a queen placed there (the cell itself included).
+
+        Returns:
+            list: Attack mask for each cell, indexed by row * size + col
+        """
+        n = self.size
+        attacks = []
+        for r in range(n):
+            for c in range(n):
+                mask = 0
+                for i in range(n):
+                    for j in range(n):
+                        if i == r or j == c or i + j == r + c or i - j == r - c:
+                            mask |= 1 << (i * n + j)
+                attacks.append(mask)
+        return attacks
+
     def reset(self, size=None):
         """
         Reset the board to the initial state.
-        
+
         Args:
             size (int, optional): New size for the board, if None the current size is used.
         """
         if size is not None:
             self.size = size
-        self.board = np.zeros((self.size, self.size))
+        self._buf = bytearray(self.size * self.size)
+        self.board = np.frombuffer(self._buf, dtype=np.uint8).reshape(self.size, self.size)
         self.queens_left = self.size
-    
+        self.rows = 0
+        self.cols = 0
+        self.diag1 = 0
+        self.diag2 = 0
+        self.conflicts = 0
+        self.row_counts = np.zeros(self.size, dtype=np.int32)
+        self.col_counts = np.zeros(self.size, dtype=np.int32)
+        self.diag_counts = np.zeros(2 * self.size - 1, dtype=np.int32)
+        self.anti_counts = np.zeros(2 * self.size - 1, dtype=np.int32)
+        self.occ = 0
+        self.attacks = self._build_attacks()
+
+    def _bump_counts(self, row, col, delta):
+        """
+        Adjust the per-line queen counts for a queen added (delta=1) or
+        removed (delta=-1) at the given cell, tracking the number of lines
+        that hold more than one queen.
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+            delta (int): +1 when placing, -1 when removing
+        """
+        n = self.size
+        for counts, idx in ((self.row_counts, row),
+                            (self.col_counts, col),
+                            (self.diag_counts, row + col),
+                            (self.anti_counts, col - row + n - 1)):
+            before = counts[idx]
+            counts[idx] = before + delta
+            if delta > 0 and before == 1:
+                self.conflicts += 1
+            elif delta < 0 and before == 2:
+                self.conflicts -= 1
+
     def place_queen(self, row, col):
         """
         Place a queen at the specified position.
-        
+
         Args:
             row (int): Row index
             col (int): Column index
-            
+
         Returns:
             bool: True if queen was successfully placed, False otherwise
         """
         if self.is_safe(row, col):
-            self.board[row, col] = 1
+            self._buf[row * self.size + col] = 1
+            self._bump_counts(row, col, 1)
+            self.rows |= 1 << row
+            self.cols |= 1 << col
+            self.diag1 |= 1 << (row + col)
+            self.diag2 |= 1 << (col - row + self.size - 1)
+            self.occ |= 1 << (row * self.size + col)
             self.queens_left -= 1
             return True
         return False
-    
+
+    def remove_queen(self, row, col):
+        """
+        Remove the queen at the specified position (undo a placement).
+
+        Args:
+            row (int): Row index
+            col (int): Column index
+        """
+        self._buf[row * self.size + col] = 0
+        self._bump_counts(row, col, -1)
+        self.rows ^= 1 << row
+        self.cols ^= 1 << col
+        self.diag1 ^= 1 << (row + col)
+        self.diag2 ^= 1 << (col - row + self.size - 1)
+        self.occ ^= 1 << (row * self.size + col)
+        self.queens_left += 1
+
     def is_safe(self, row, col):
         """
         Check if it's safe to place a queen at the specified position.
-        
+
         Args:
             row (int): Row index
             col (int): Column index
-            
+
         Returns:
             bool: True if position is safe, False otherwise
         """
-        n = self.size
+        # One AND against the precomputed attack mask of the cell; the mask
+        # covers the cell itself, so occupancy is included in the test
+        return not (self.occ & self.attacks[row * self.size + col])
 
-        # Check if the position is already occupied
-        if self.board[row, col] == 1:
-            return False
-
-        # Check row and column
-        for i in range(n):
-            if self.board[row, i] == 1 or self.board[i, col] == 1:
-                return False
+    def next_free_row(self):
+        """
+        Get the lowest row that does not contain a queen yet.
 
-        # Check diagonals
-        for i in range(n):
-            for j in range(n):
-                if (i + j == row + col) or (i - j == row - col):
-                    if self.board[i, j] == 1:
-                        return False
+        Returns:
+            int: Row index, or None if every row is occupied
+        """
+        for row in range(self.size):
+            if not (self.rows >> row) & 1:
+                return row
+        return None
 
-        return True
-    
-    def evaluate(self):
+    def safe_cols_for_row(self, row):
         """
-        Evaluate the current board state for the minimax algorithm.
-        
+        Get the columns where a queen can safely be placed in the given row.
+
+        Args:
+            row (int): Row index
+
         Returns:
-            int: Score representing how many conflicts exist
+            list: List of safe column indices
         """
+        cols = []
         n = self.size
-        score = 0
+        free = ~(self.cols | (self.diag1 >> row) | (self.diag2 >> (n - 1 - row))) & ((1 << n) - 1)
+        while free:
+            bit = free & -free
+            free ^= bit
+            cols.append(bit.bit_length() - 1)
+        return cols
 
-        # Count the number of queens in each row
-        row_counts = np.sum(self.board, axis=1)
-        score += np.sum(row_counts > 1)
+    def safe_mask(self):
+        """
+        Compute the boolean mask of all safe empty cells in one vectorized
+        pass over the per-line count arrays.
 
-        # Count the number of queens in each column
-        col_counts = np.sum(self.board, axis=0)
-        score += np.sum(col_counts > 1)
+        Returns:
+            numpy.ndarray: Boolean (size, size) array, True where a queen
+            can safely be placed
+        """
+        n = self.size
+        i, j = np.indices((n, n))
+        return ((self.board == 0)
+                & (self.row_counts[i] == 0)
+                & (self.col_counts[j] == 0)
+                & (self.diag_counts[i + j] == 0)
+                & (self.anti_counts[j - i + n - 1] == 0))
+
+    def evaluate(self):
+        """
+        Evaluate the current board state for the minimax algorithm.
 
-        # Count the number of queens in each diagonal
-        diagonal_counts = []
-        for i in range(2 * n - 1):
-            diagonal_counts.append(np.sum(np.diagonal(self.board, i - n + 1)))
-            diagonal_counts.append(np.sum(np.diagonal(np.fliplr(self.board), i - n + 1)))
-        score += np.sum(np.array(diagonal_counts) > 1)
+        Returns:
+            int: Score representing how many conflicts exist
+        """
+        # The conflict count is maintained incrementally by
+        # place_queen/remove_queen, so evaluation is O(1) per leaf instead of
+        # rebuilding every row, column and diagonal sum
+        return self.conflicts
 
-        return score
-    
     def is_game_over(self):
         """
         Check if the game is over (all queens placed).
-        
+
         Returns:
             bool: True if game is over, False otherwise
         """
-        return np.sum(self.board) == self.size
-    
+        return self.queens_left == 0
+
     def print_board(self):
         """
         Print the current board state to the console.
@@ -123,4 +243,4 @@ class Board:
                     print('Q', end=' ')
                 else:
                     print('.', end=' ')
-            print()
\ No newline at end of file
+            print()
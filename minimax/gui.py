@@ -3,15 +3,23 @@ N-Queens Game - GUI Module
 This module contains the graphical user interface for the N-Queens game.
 """
 import os
+import queue
+import threading
 import tkinter as tk
-from tkinter import messagebox, simpledialog
-from PIL import ImageTk, Image
+from tkinter import simpledialog
+from PIL import ImageTk, Image, ImageDraw
 import numpy as np
 
 from board import Board
 from minimax import MinimaxAI
 
 class NQueensGUI:
+    # Scaled queen sprites, cached per cell size so resets never re-decode
+    _queen_cache = {}
+
+    # Rendered checkerboard backgrounds, cached per (size, cell size)
+    _bg_cache = {}
+
     def __init__(self, root):
         """
         Initialize the N-Queens GUI.
@@ -56,10 +64,16 @@ class NQueensGUI:
                                     bd=1, relief=tk.SUNKEN, anchor=tk.W)
         self.status_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=5)
         
+        # The AI searches on a worker thread so Tk stays responsive; results
+        # come back through this queue
+        self._ai_queue = queue.Queue()
+        self._ai_busy = False
+
         # Load the queen image
         self.load_queen_image()
-        
-        # Draw the initial board
+
+        # Create the board cells once and draw the initial state
+        self._build_board_items()
         self.draw_board()
         
         # Bind click event
@@ -67,12 +81,17 @@ class NQueensGUI:
         
     def load_queen_image(self):
         """
-        Load the queen image for the board.
+        Load the queen image for the board, reusing the cached sprite if one
+        was already prepared for this cell size.
         """
+        if self.cell_size in self._queen_cache:
+            self.queen_photo = self._queen_cache[self.cell_size]
+            return
+
         # Check if images directory exists
         if not os.path.exists("images"):
             os.makedirs("images")
-            
+
         # Check if Queen.jpg exists, if not create a placeholder
         if not os.path.exists("images/Queen.jpg"):
             # Create a placeholder image with a simple queen symbol
@@ -80,36 +99,71 @@ class NQueensGUI:
             self.queen_photo = ImageTk.PhotoImage(img)
             print("Warning: Queen.jpg not found. Using placeholder image.")
         else:
-            # Load the actual queen image
-            queen_image = Image.open("images/Queen.jpg")
+            # Load the actual queen image; decode to RGBA up front so Tk
+            # gets pixels it can blit without converting again
+            queen_image = Image.open("images/Queen.jpg").convert('RGBA')
             queen_image = queen_image.resize((self.cell_size, self.cell_size), Image.LANCZOS)
+            queen_image.load()
             self.queen_photo = ImageTk.PhotoImage(queen_image)
+
+        self._queen_cache[self.cell_size] = self.queen_photo
     
-    def draw_board(self):
+    def _render_background(self):
+        """
+        Render the checkerboard as one PIL image, reusing the cached copy
+        if one was already rendered for this size.
+
+        Returns:
+            ImageTk.PhotoImage: The full-board checker pattern
+        """
+        key = (self.n, self.cell_size)
+        if key not in self._bg_cache:
+            s = self.cell_size
+            bg = Image.new('RGB', (self.n * s, self.n * s))
+            draw = ImageDraw.Draw(bg)
+            for row in range(self.n):
+                for col in range(self.n):
+                    color = 'white' if (row + col) % 2 == 0 else 'gray'
+                    draw.rectangle((col * s, row * s, (col + 1) * s - 1,
+                                    (row + 1) * s - 1), fill=color)
+            self._bg_cache[key] = ImageTk.PhotoImage(bg)
+        return self._bg_cache[key]
+
+    def _build_board_items(self):
         """
-        Draw the chess board and queens.
+        Create the board items once: the checkerboard is a single
+        pre-rendered image instead of n*n rectangles, and subsequent draws
+        only touch the queen images on top of it.
         """
         self.canvas.delete("all")
-        
-        # Draw the chess board
-        for row in range(self.n):
-            for col in range(self.n):
-                color = 'white' if (row + col) % 2 == 0 else 'gray'
-                self.canvas.create_rectangle(
-                    col * self.cell_size, row * self.cell_size, 
-                    (col + 1) * self.cell_size, (row + 1) * self.cell_size,
-                    fill=color
-                )
-        
-        # Place the queens on the board
+        self._bg_photo = self._render_background()
+        self.canvas.create_image(0, 0, anchor='nw', image=self._bg_photo)
+
+        # A game never shows more than n queens, so preallocate that many
+        # hidden image items and reposition them instead of creating new ones
+        self._queen_pool = [
+            self.canvas.create_image(-self.cell_size, -self.cell_size,
+                                     anchor='nw', image=self.queen_photo,
+                                     state='hidden')
+            for _ in range(self.n)
+        ]
+
+    def draw_board(self):
+        """
+        Sync the canvas with the board: move pooled queen images onto the
+        occupied cells and hide the spares.
+        """
+        used = 0
         for i in range(self.n):
             for j in range(self.n):
                 if self.board.board[i, j] == 1:
-                    self.canvas.create_image(
-                        j * self.cell_size, i * self.cell_size, 
-                        anchor='nw', image=self.queen_photo
-                    )
-        
+                    item = self._queen_pool[used]
+                    used += 1
+                    self.canvas.coords(item, j * self.cell_size, i * self.cell_size)
+                    self.canvas.itemconfigure(item, state='normal')
+        for item in self._queen_pool[used:]:
+            self.canvas.itemconfigure(item, state='hidden')
+
         # Update the status
         self.status_var.set(f"Queens left to place: {self.board.queens_left}")
         
@@ -120,55 +174,108 @@ class NQueensGUI:
         Args:
             event: The mouse click event
         """
+        if self._ai_busy:  # The worker thread owns the board right now
+            return
+
         if self.board.is_game_over():  # Game already over
-            messagebox.showinfo("Game Over", "Game is already finished! Reset to play again.")
+            self.status_var.set("Game is already finished! Reset to play again.")
             return
-        
+
         # Calculate the clicked cell
         col = event.x // self.cell_size
         row = event.y // self.cell_size
-        
+
         if self.board.queens_left > 0:
             if self.board.board[row, col] == 0:
                 if self.board.is_safe(row, col):
                     # Place the queen
                     self.board.place_queen(row, col)
                     self.draw_board()
-                    
+
                     # Check if game is over
                     if self.board.is_game_over():
-                        messagebox.showinfo("Game Over", "You placed all the queens!")
+                        self.status_var.set("Game over - you placed all the queens!")
                     else:
                         # AI's turn
                         self.make_ai_move()
                 else:
-                    messagebox.showwarning("Invalid Move", "The position is unsafe. Try again.")
+                    self._flash_unsafe(row, col)
         else:
-            messagebox.showinfo("Game Over", "No more queens left to place!")
+            self.status_var.set("Game over - no more queens left to place!")
+
+    def _flash_unsafe(self, row, col):
+        """
+        Reject an unsafe click with a status message and a brief red
+        outline on the cell - no modal dialog blocking the event loop.
+
+        Args:
+            row (int): Row index of the rejected cell
+            col (int): Column index of the rejected cell
+        """
+        self.status_var.set("Unsafe position - try again.")
+        self.canvas.create_rectangle(
+            col * self.cell_size, row * self.cell_size,
+            (col + 1) * self.cell_size, (row + 1) * self.cell_size,
+            outline='red', width=3, tags='warning'
+        )
+        self.root.after(400, lambda: self.canvas.delete('warning'))
     
     def make_ai_move(self):
         """
-        Make the AI's move.
+        Start the AI's move on a worker thread and poll for the result.
+        """
+        if self._ai_busy:
+            return
+        self._ai_busy = True
+        self.status_var.set("AI is thinking...")
+        threading.Thread(target=self._ai_worker, daemon=True).start()
+        self.root.after(30, self._poll_ai)
+
+    def _ai_worker(self):
+        """
+        Run the search off the Tk main thread and queue the result.
+        """
+        self._ai_queue.put(self.ai.get_best_move())
+
+    def _poll_ai(self):
+        """
+        Check whether the worker thread has finished; reschedule if not.
+        """
+        try:
+            move = self._ai_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(30, self._poll_ai)
+            return
+        self._ai_busy = False
+        self._apply_ai_move(move)
+
+    def _apply_ai_move(self, move):
+        """
+        Apply the move the search came back with.
+
+        Args:
+            move: (row, col) tuple, or None if the AI had no safe position
         """
-        move = self.ai.get_best_move()
         if move is None:  # No valid moves left
             if self.board.is_game_over():
-                messagebox.showinfo("Game Over", "All queens placed successfully!")
+                self.status_var.set("Game over - all queens placed successfully!")
             else:
-                messagebox.showinfo("Game Over", "No safe positions left!")
+                self.status_var.set("Game over - no safe positions left!")
             return
-        
+
         row, col = move
         self.board.place_queen(row, col)
         self.draw_board()
-        
+
         if self.board.is_game_over():
-            messagebox.showinfo("Game Over", "All queens placed successfully!")
+            self.status_var.set("Game over - all queens placed successfully!")
     
     def reset_game(self):
         """
         Reset the game with a new board size.
         """
+        if self._ai_busy:  # Don't pull the board out from under the search
+            return
         new_size = simpledialog.askinteger("N-Queens Game", "Enter the size of the board:", 
                                          minvalue=4, maxvalue=12, initialvalue=self.n)
         if new_size is not None:
@@ -178,6 +285,7 @@ class NQueensGUI:
             
             # Resize the canvas
             self.canvas.config(width=self.n * self.cell_size, height=self.n * self.cell_size)
-            
-            # Redraw the board
+
+            # Rebuild the cells for the new size and redraw the board
+            self._build_board_items()
             self.draw_board()
\ No newline at end of file
@@ -2,74 +2,483 @@
 N-Queens Game - Minimax Module
 This module contains the AI logic using the minimax algorithm.
 """
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import random
+import time
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is an optional accelerator; fall back to pure Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Integer score sentinels: conflict counts are small, and plain int
+# comparisons are cheaper than boxed float('inf') ones
+NEG_INF = -(1 << 30)
+POS_INF = 1 << 30
+
+# Transposition-table entry flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+
+# Half-width of the aspiration window around the previous depth's score
+ASPIRATION_WINDOW = 2
+
+# Evict the table once it grows past this many entries
+TT_MAX_ENTRIES = 1 << 18
+
+
+@njit(cache=True)
+def _popcount(x):
+    """
+    Count the set bits of a non-negative integer.
+
+    Args:
+        x (int): Value to count bits in
+
+    Returns:
+        int: Number of set bits
+    """
+    count = 0
+    while x:
+        x &= x - 1
+        count += 1
+    return count
+
+
+# Note: no cache=True here — numba's on-disk caching is unreliable for
+# self-recursive functions and can crash at load time
+@njit
+def _minimax_search(rows, cols, diag1, diag2, n, depth, alpha, beta, color,
+                    conflicts, queens_left):
+    """
+    Negamax recursion with alpha-beta pruning over bitmask state.
+
+    Scores are from the side-to-move's perspective: each level negates the
+    child's score and searches with the window flipped to (-beta, -alpha),
+    so one branch serves both players. Only safe placements are explored,
+    so the conflict count never changes below the root and is threaded
+    through as a plain integer, as is the number of queens still to place.
+
+    Args:
+        rows (int): Bitmask of occupied rows
+        cols (int): Bitmask of occupied columns
+        diag1 (int): Bitmask of occupied "/" diagonals
+        diag2 (int): Bitmask of occupied "\\" diagonals
+        n (int): Board size
+        depth (int): Remaining search depth
+        alpha (int): Alpha value for pruning
+        beta (int): Beta value for pruning
+        color (int): +1 if the maximizing player is to move, -1 otherwise
+        conflicts (int): Conflict count of the position being searched
+        queens_left (int): Queens still to place
+
+    Returns:
+        int: The evaluation score for the side to move
+    """
+    # Terminal conditions - plain integer tests, no board scan
+    if depth == 0 or queens_left == 0:
+        return color * conflicts
+
+    full = (1 << n) - 1
+
+    # Branch only on the safe columns of the next unassigned row
+    row = 0
+    for r in range(n):
+        if not (rows >> r) & 1:
+            row = r
+            break
+    free = ~(cols | (diag1 >> row) | (diag2 >> (n - 1 - row))) & full
+    if free == 0:
+        return color * conflicts
+
+    # The free row that would be searched after this one, for move ordering
+    next_row = -1
+    for r in range(row + 1, n):
+        if not (rows >> r) & 1:
+            next_row = r
+            break
+
+    # Collect candidate columns, insertion-sorted by how constrained the
+    # following row becomes (fewest remaining options first)
+    cand_cols = np.empty(n, np.int64)
+    cand_keys = np.empty(n, np.int64)
+    count = 0
+    f = free
+    while f:
+        bit = f & -f
+        f ^= bit
+        col = 0
+        b = bit
+        while b > 1:
+            b >>= 1
+            col += 1
+        key = 0
+        if next_row >= 0:
+            new_cols = cols | bit
+            new_d1 = diag1 | (1 << (row + col))
+            new_d2 = diag2 | (1 << (col - row + n - 1))
+            key = _popcount(
+                ~(new_cols | (new_d1 >> next_row) | (new_d2 >> (n - 1 - next_row))) & full
+            )
+        i = count
+        while i > 0 and cand_keys[i - 1] > key:
+            cand_keys[i] = cand_keys[i - 1]
+            cand_cols[i] = cand_cols[i - 1]
+            i -= 1
+        cand_keys[i] = key
+        cand_cols[i] = col
+        count += 1
+
+    best = -(1 << 30)
+    new_rows = rows | (1 << row)
+    for idx in range(count):
+        col = cand_cols[idx]
+        value = -_minimax_search(
+            new_rows,
+            cols | (1 << col),
+            diag1 | (1 << (row + col)),
+            diag2 | (1 << (col - row + n - 1)),
+            n, depth - 1, -beta, -alpha, -color, conflicts, queens_left - 1
+        )
+
+        # Update best score and alpha
+        if value > best:
+            best = value
+        if value > alpha:
+            alpha = value
+
+        # Alpha-Beta pruning
+        if alpha >= beta:
+            break
+
+    return best
+
+
+# Note: no cache=True here — numba's on-disk caching is unreliable for
+# self-recursive functions and can crash at load time
+@njit
+def _solve_bitmask(cols, d1, d2, n):
+    """
+    Pure backtracking N-Queens solver over shifting diagonal masks.
+
+    Fills the remaining rows top to bottom; d1 and d2 are the diagonal
+    attacks relative to the current row, so they just shift by one bit per
+    level instead of being re-indexed.
+
+    Args:
+        cols (int): Bitmask of occupied columns
+        d1 (int): "/" diagonal attacks shifted to the current row
+        d2 (int): "\\" diagonal attacks shifted to the current row
+        n (int): Board size
+
+    Returns:
+        int: A column for the current row that completes to a full
+        solution, or -1 if none exists
+    """
+    full = (1 << n) - 1
+    if cols == full:
+        return n
+    free = ~(cols | d1 | d2) & full
+    while free:
+        bit = free & -free
+        free ^= bit
+        if _solve_bitmask(cols | bit, ((d1 | bit) << 1) & full,
+                          (d2 | bit) >> 1, n) >= 0:
+            col = 0
+            b = bit
+            while b > 1:
+                b >>= 1
+                col += 1
+            return col
+    return -1
+
+
+def _eval_root_move(args):
+    """
+    Evaluate one root move in a worker process.
+
+    Args:
+        args (tuple): Post-move state and remaining depth, as
+            (rows, cols, diag1, diag2, n, depth, conflicts, queens_left)
+
+    Returns:
+        int: Score for the root player
+    """
+    rows, cols, diag1, diag2, n, depth, conflicts, queens_left = args
+
+    # The opponent replies, so search with color=-1 and negate back
+    value = _minimax_search(rows, cols, diag1, diag2, n, depth,
+                            NEG_INF, POS_INF, -1, conflicts, queens_left)
+    return -value
+
 
 class MinimaxAI:
-    def __init__(self, board):
+    # Fixed attribute layout: no per-instance __dict__, and attribute access
+    # skips a dict lookup on every hot-path read
+    __slots__ = ('board', 'max_depth', 'time_budget', 'zobrist', 'hash_key',
+                 'tt', 'last_best', '_pool')
+
+    def __init__(self, board, max_depth=3, time_budget=1.0):
         """
         Initialize the Minimax AI with a board.
-        
+
         Args:
             board: The Board object
+            max_depth (int): Deepest iteration get_best_move may run
+            time_budget (float): Wall-clock seconds a move search may take
         """
         self.board = board
-    
-    def minimax(self, depth, is_maximizing_player):
-        if depth == 0 or np.sum(self.board.board) == self.board.size:
-            return self.board.evaluate()
-
-        if is_maximizing_player:
-            max_eval = float('-inf')
-            for i in range(self.board.size):
-                for j in range(self.board.size):
-                    if self.board.board[i, j] == 0 and self.board.is_safe(i, j):
-                        self.board.board[i, j] = 1
-                        eval = self.minimax(depth - 1, False)
-                        self.board.board[i, j] = 0
-                        max_eval = max(max_eval, eval)
-                        
-            return max_eval
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        # Zobrist hashing: one random 64-bit key per cell, XOR-toggled as
+        # queens are placed and removed, so the position hash is incremental.
+        # Plain Python ints in a flat list - np.uint64 scalars would box on
+        # every XOR
+        self.zobrist = [random.getrandbits(64)
+                        for _ in range(board.size * board.size)]
+        self.hash_key = 0
+        # Transposition table: (hash, side to move) -> (depth, value, flag)
+        self.tt = {}
+        # Best root move of the previous search, tried first the next time
+        self.last_best = None
+        # Worker pool for root-level parallel search, created on first use
+        self._pool = None
+        # Warm the JIT on a trivial position so compilation does not land on
+        # the first interactive move
+        if NUMBA_AVAILABLE:
+            _minimax_search(0, 0, 0, 0, 1, 1, NEG_INF, POS_INF, 1, 0, 1)
+            _solve_bitmask(0, 0, 0, 1)
+
+    def minimax(self, depth, is_maximizing_player, alpha=NEG_INF, beta=POS_INF):
+        """
+        Run minimax from the current board position.
+
+        The recursion itself lives in the module-level negamax kernel so
+        numba can compile it; the transposition table stays up here, as
+        dicts cannot cross into nopython mode.
 
+        Args:
+            depth (int): Remaining search depth
+            is_maximizing_player (bool): True if the maximizing player is to move
+            alpha (int): Alpha value for pruning
+            beta (int): Beta value for pruning
+
+        Returns:
+            int: The evaluation score
+        """
+        key = (self.hash_key, is_maximizing_player)
+        entry = self.tt.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, value, flag = entry
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER and value >= beta:
+                return value
+            if flag == TT_UPPER and value <= alpha:
+                return value
+
+        # The kernel works in the side-to-move frame; flip the window and
+        # the returned score for the minimizing player
+        color = 1 if is_maximizing_player else -1
+        a, b = (alpha, beta) if color == 1 else (-beta, -alpha)
+
+        board = self.board
+        value = color * _minimax_search(board.rows, board.cols, board.diag1,
+                                        board.diag2, board.size, depth, a, b,
+                                        color, board.conflicts,
+                                        board.queens_left)
+
+        if value <= alpha:
+            flag = TT_UPPER
+        elif value >= beta:
+            flag = TT_LOWER
         else:
-            min_eval = float('inf')
-            for i in range(self.board.size):
-                for j in range(self.board.size):
-                    if self.board.board[i, j] == 0 and self.board.is_safe(i, j):
-                        self.board.board[i, j] = 1
-                        eval = self.minimax(depth - 1, True)
-                        self.board.board[i, j] = 0
-                        min_eval = min(min_eval, eval)
-
-            return min_eval
-    
+            flag = TT_EXACT
+        self._store(key, depth, value, flag)
+        return value
+
+    def _store(self, key, depth, value, flag=TT_EXACT):
+        """
+        Store a search result in the transposition table, evicting the
+        whole table if it has grown too large.
+
+        Args:
+            key (tuple): (hash, side to move)
+            depth (int): Depth the value was searched to
+            value: The search result
+            flag (int): Bound type of the value
+        """
+        if len(self.tt) > TT_MAX_ENTRIES:
+            self.tt.clear()
+        self.tt[key] = (depth, value, flag)
+
     def get_best_move(self):
         """
         Find the best move for the AI.
-        
+
         Returns:
             tuple: (row, col) or None if no valid moves
         """
-        best_score = float('-inf')
+        best_score = NEG_INF
         best_move = None
         valid_moves = []
-        
-        # First collect all valid moves
-        for i in range(self.board.size):
-            for j in range(self.board.size):
-                if self.board.board[i, j] == 0 and self.board.is_safe(i, j):
-                    valid_moves.append((i, j))
-        
+
+        # The human's moves don't pass through this class, so re-derive the
+        # hash from the board before searching; the table persists across
+        # turns and must not mix positions
+        n = self.board.size
+        self.hash_key = 0
+        for i, j in np.argwhere(self.board.board == 1):
+            self.hash_key ^= self.zobrist[i * n + j]
+
+        # Enumerate all safe cells with one vectorized pass, then keep the
+        # first row that still offers one; the human may have filled rows
+        # out of order
+        candidates = np.argwhere(self.board.safe_mask())
+        if candidates.size:
+            first_row = candidates[0, 0]
+            valid_moves = [(int(r), int(c)) for r, c in candidates if r == first_row]
+
         # If no valid moves, return None
         if not valid_moves:
             return None
-        
-        # Evaluate each valid move
+
+        # With nothing on the board there is no adversary to out-search: a
+        # straight backtracking solve finds a completable opening column in
+        # microseconds where the game tree takes seconds
+        if self.board.queens_left == self.board.size:
+            col = _solve_bitmask(0, 0, 0, self.board.size)
+            if col >= 0:
+                self.last_best = (0, col)
+                return self.last_best
+
+        # On an empty board column c and its mirror n-1-c lead to reflected,
+        # equivalent games, so only the left half needs to be searched
+        if self.board.queens_left == self.board.size:
+            half = (self.board.size + 1) // 2
+            valid_moves = [(i, j) for i, j in valid_moves if j < half]
+
+        # Seed the root with the previous search's best move; with the
+        # transposition table warm it is the cheapest line to re-verify
+        if self.last_best in valid_moves:
+            valid_moves.remove(self.last_best)
+            valid_moves.insert(0, self.last_best)
+
+        # Deep searches farm the independent root subtrees out to worker
+        # processes; shallow ones aren't worth the dispatch overhead
+        if self.max_depth > 2 and len(valid_moves) > 1:
+            best_move = self._search_root_parallel(valid_moves)
+            self.last_best = best_move
+            return best_move
+
+        # Deepen iteratively: each completed depth's scores order the next
+        # one, and the deadline keeps the AI responsive - a depth that does
+        # not finish in time is discarded in favor of the last completed one
+        # Hoist the attribute chains used once per root move into locals;
+        # LOAD_FAST beats chained LOAD_ATTR in this loop
+        board = self.board
+        place_queen = board.place_queen
+        remove_queen = board.remove_queen
+        zobrist = self.zobrist
+
+        deadline = time.monotonic() + self.time_budget
+        for d in range(1, self.max_depth + 1):
+            # Aspiration window around the previous depth's score; a result
+            # at or beyond either bound is only a bound itself, so the depth
+            # is re-searched with the window wide open
+            if best_move is None:
+                low, high = NEG_INF, POS_INF
+            else:
+                low = best_score - ASPIRATION_WINDOW
+                high = best_score + ASPIRATION_WINDOW
+
+            while True:
+                depth_scores = {}
+                depth_best_score = NEG_INF
+                depth_best = None
+                out_of_time = False
+                a = low
+
+                for i, j in valid_moves:
+                    key = zobrist[i * n + j]
+                    place_queen(i, j)
+                    self.hash_key ^= key
+                    score = self.minimax(d, False, a, high)
+                    self.hash_key ^= key
+                    remove_queen(i, j)
+                    depth_scores[(i, j)] = score
+                    if score > depth_best_score:
+                        depth_best_score = score
+                        depth_best = (i, j)
+                    if score > a:
+                        a = score
+                    if time.monotonic() > deadline:
+                        out_of_time = True
+                        break
+
+                if (not out_of_time and low != NEG_INF
+                        and (depth_best_score <= low or depth_best_score >= high)):
+                    low, high = NEG_INF, POS_INF
+                    continue
+                break
+
+            if out_of_time and best_move is not None:
+                break
+            best_score = depth_best_score
+            best_move = depth_best
+            valid_moves.sort(key=lambda m: depth_scores.get(m, best_score),
+                             reverse=True)
+            if out_of_time:
+                break
+
+        self.last_best = best_move
+        return best_move
+
+    def _search_root_parallel(self, valid_moves):
+        """
+        Evaluate each root move in its own worker process.
+
+        Root subtrees are independent, so they parallelize cleanly. The
+        transposition table and deepening order are process-local, so each
+        worker runs a single full-depth search of its subtree instead.
+
+        Args:
+            valid_moves (list): Candidate (row, col) root moves
+
+        Returns:
+            tuple: Best (row, col) found
+        """
+        board = self.board
+        n = board.size
+
+        tasks = []
         for i, j in valid_moves:
-            self.board.board[i, j] = 1
-            score = self.minimax(3, False)
-            self.board.board[i, j] = 0
+            tasks.append((
+                board.rows | (1 << i),
+                board.cols | (1 << j),
+                board.diag1 | (1 << (i + j)),
+                board.diag2 | (1 << (j - i + n - 1)),
+                n, self.max_depth, board.conflicts, board.queens_left - 1
+            ))
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor()
+
+        best_score = NEG_INF
+        best_move = None
+        for move, score in zip(valid_moves, self._pool.map(_eval_root_move, tasks)):
             if score > best_score:
                 best_score = score
-                best_move = (i, j)
-        
-        return best_move
\ No newline at end of file
+                best_move = move
+        return best_move